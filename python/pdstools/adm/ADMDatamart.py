@@ -122,16 +122,11 @@ class ADMDatamart:
         self.agb = AGB(datamart=self)
         self.generate = Reports(datamart=self)
 
-        model_data_validated = self._validate_model_data(
+        # first_action_dates is derived before the query is applied
+        self.model_data, self.first_action_dates = self._validate_model_data(
             model_df,
             extract_pyname_keys=extract_pyname_keys,
-        )
-
-        # First occurence of actions (before filtering!) kept here so we can derive the "New Actions"
-        self.first_action_dates = self._get_first_action_dates(model_data_validated)
-
-        self.model_data = (
-            cdh_utils._apply_query(model_data_validated, query) if model_data_validated is not None else None
+            query=query,
         )
 
         # NOTE: model and predictor data are validated independently. When a
@@ -153,7 +148,13 @@ class ADMDatamart:
     ) -> pl.LazyFrame | None:
         if df is None:
             return df
-        return df.group_by("Name").agg(ActionFirstSnapshotTime=pl.col("SnapshotTime").min()).sort("Name")
+        # Derived before the schema types are applied, so align Name with
+        # the Utf8 type model_data ends up with for the later joins
+        return (
+            df.group_by(pl.col("Name").cast(pl.Utf8))
+            .agg(ActionFirstSnapshotTime=pl.col("SnapshotTime").min())
+            .sort("Name")
+        )
 
     def _require_model_data(self) -> pl.LazyFrame:
         """Return ``model_data`` or raise a clear error if it isn't loaded.
@@ -558,26 +559,35 @@ class ADMDatamart:
         self,
         df: pl.LazyFrame | None,
         extract_pyname_keys: bool = True,
-    ) -> pl.LazyFrame | None:
-        """Internal method to validate model data"""
+        query: QUERY | None = None,
+    ) -> tuple[pl.LazyFrame | None, pl.LazyFrame | None]:
+        """Internal method to validate model data
+
+        Returns the validated model data and the first action dates, which
+        are derived from the data before ``query`` is applied. When the query
+        only references model-level columns, it is applied before the derived
+        columns are computed so filtered-out models skip that work; otherwise
+        it is applied at the end.
+        """
         if df is None:
             logger.info("No model data available.")
-            return df
+            return None, None
 
         df = _polars_capitalize(df)
         schema = df.collect_schema()
-        if extract_pyname_keys and "Name" in schema.names():
+        names = set(schema.names())
+        if extract_pyname_keys and "Name" in names:
             df = cdh_utils._extract_keys(df)
 
-        if "Treatment" in schema.names():
+        if "Treatment" in names:
             self.context_keys.append("Treatment")
 
         # Model technique (NaiveBayes or GradientBoost) added in '24 (US-648869 and related)
-        if "ModelTechnique" not in schema.names():
+        if "ModelTechnique" not in names:
             df = df.with_columns(
                 ModelTechnique=pl.lit(None),
             )
-        self.context_keys = [k for k in self.context_keys if k in schema.names()]
+        self.context_keys = [k for k in self.context_keys if k in names]
 
         snapshot_type = schema.get("SnapshotTime")
         if snapshot_type is None or not snapshot_type.is_temporal():  # pl.Datetime
@@ -590,10 +600,25 @@ class ADMDatamart:
                 "ModelID",
             )
 
+        # First occurence of actions (before filtering!) kept here so we can derive the "New Actions"
+        first_action_dates = self._get_first_action_dates(df)
+
+        # Filtering whole models commutes with the per-model derivations
+        # below, so such queries can run before them. The query is written
+        # against the schema types, so the columns it uses are cast first.
+        if self._is_model_level_query(query, df.collect_schema().names()):
+            typed_schema = cdh_utils._apply_schema_types(
+                df.select(self._query_columns(query)),
+                Schema.ADMModelSnapshot,
+            ).collect_schema()
+            df = df.with_columns(pl.col(name).cast(dtype, strict=False) for name, dtype in typed_schema.items())
+            df = cdh_utils._apply_query(df, query)
+            query = None
+
         df = df.with_columns(
-            SuccessRate=(pl.col("Positives") / pl.col("ResponseCount")).fill_nan(
-                pl.lit(0),
-            ),
+            SuccessRate=pl.when(pl.col("ResponseCount") == 0)
+            .then(0.0)
+            .otherwise(pl.col("Positives") / pl.col("ResponseCount")),
             IsUpdated=((pl.col("ResponseCount").diff(1) != 0) | (pl.col("Positives").diff(1) != 0))
             .fill_null(True)
             .over("ModelID"),
@@ -605,7 +630,24 @@ class ADMDatamart:
 
         df = self._normalize_performance_scale(df)
 
-        return df
+        return cdh_utils._apply_query(df, query), first_action_dates
+
+    @staticmethod
+    def _query_columns(query: QUERY | None) -> set[str]:
+        """The columns ``query`` references, or an empty set if unknown."""
+        if isinstance(query, pl.Expr):
+            return set(query.meta.root_names())
+        if isinstance(query, (list, tuple)) and all(isinstance(expr, pl.Expr) for expr in query):
+            return {root_name for expr in query for root_name in expr.meta.root_names()}
+        if isinstance(query, dict):
+            return set(query.keys())
+        return set()
+
+    def _is_model_level_query(self, query: QUERY | None, columns: list[str]) -> bool:
+        """Whether ``query`` only references columns that are constant per model."""
+        query_columns = self._query_columns(query)
+        model_level_columns = {"ModelID", "Configuration", "ModelTechnique", *self.context_keys}
+        return bool(query_columns) and query_columns <= model_level_columns.intersection(columns)
 
     def _validate_predictor_data(
         self,
@@ -617,20 +659,27 @@ class ADMDatamart:
             return df
         df = _polars_capitalize(df)
         schema = df.collect_schema()
+        names = set(schema.names())
 
-        if "BinResponseCount" not in schema.names():
-            df = df.with_columns(
-                BinResponseCount=(pl.col("BinPositives") + pl.col("BinNegatives")),
-            )
-        df = df.with_columns(
-            BinPropensity=pl.col("BinPositives") / pl.col("BinResponseCount"),
-            BinAdjustedPropensity=((pl.col("BinPositives") + pl.lit(0.5)) / (pl.col("BinResponseCount") + pl.lit(1))),
-        )
+        # Derive BinResponseCount (when absent) in the same projection as the
+        # propensities so Polars can share the subexpression in one pass.
+        if "BinResponseCount" not in names:
+            bin_response_count = pl.col("BinPositives") + pl.col("BinNegatives")
+        else:
+            bin_response_count = pl.col("BinResponseCount")
+        derived_columns = {
+            "BinResponseCount": bin_response_count,
+            "BinPropensity": pl.col("BinPositives") / bin_response_count,
+            "BinAdjustedPropensity": (pl.col("BinPositives") + 0.5) / (bin_response_count + 1),
+        }
         snapshot_type = schema.get("SnapshotTime")
         if snapshot_type is None or not snapshot_type.is_temporal():  # pl.Datetime
-            df = df.with_columns(SnapshotTime=cdh_utils.parse_pega_date_time_formats())
+            derived_columns["SnapshotTime"] = cdh_utils.parse_pega_date_time_formats()
+        df = df.with_columns(**derived_columns)
 
-        if "PredictorCategory" not in schema.names():
+        # Categorization stays a join on the unique predictor names: that is
+        # cheaper than evaluating the string expression for every bin row.
+        if "PredictorCategory" not in names:
             df = self.apply_predictor_categorization(
                 df=df,
             )  # actual categorization not passed in?
@@ -794,7 +843,10 @@ class ADMDatamart:
 
         """
         abs_path = Path(path).resolve()
-        time = datetime.datetime.now().strftime("%Y%m%dT%H%M%S.%f")[:-3]
+        now = datetime.datetime.now()
+        # Not a "." before the milliseconds: cache_to_file would treat it as
+        # the file extension and replace it.
+        time = f"{now:%Y%m%dT%H%M%S}_{now.microsecond // 1000:03d}"
         modeldata_cache, predictordata_cache = None, None
         if self.model_data is not None:
             if selected_model_ids is None:
@@ -827,6 +879,37 @@ class ADMDatamart:
 
         return modeldata_cache, predictordata_cache
 
+    def materialize_for_reporting(self) -> None:
+        """Collect the model data once and keep it in memory.
+
+        Reports compute many small statistics over ``model_data``. As a
+        LazyFrame, every one of those re-runs the full scan and validation
+        pipeline. Call this once after loading to swap ``model_data`` and
+        ``first_action_dates`` for in-memory frames, so subsequent queries
+        only scan the collected data. Both are collected together, sharing
+        the scan of the source. ``combined_data`` is rebuilt on top of the
+        materialized model data.
+
+        Examples
+        --------
+        >>> dm = ADMDatamart.from_ds_export(base_path="/my_export_folder")
+        >>> dm.materialize_for_reporting()
+        """
+        if self.model_data is None:
+            return
+        if self.first_action_dates is None:
+            self.model_data = self.model_data.collect().lazy()
+        else:
+            # first_action_dates is derived before any query is applied, so it
+            # cannot be recomputed from the collected model_data
+            model_data, first_action_dates = pl.collect_all([self.model_data, self.first_action_dates])
+            self.model_data = model_data.lazy()
+            self.first_action_dates = first_action_dates.lazy()
+        self.combined_data = self.aggregates._combine_data(
+            self.model_data,
+            self.predictor_data,
+        )
+
     def _unique_sorted_from_model_data(self, expr: pl.Expr, alias: str) -> list[str]:
         """Helper for the ``unique_*`` cached_properties on model data.
 
@@ -2,12 +2,17 @@ from typing import Any
 
 from httpx import URL, Response
 
+# Default for PegaException's ``content``: the body has not been parsed yet.
+# Passing ``content=None`` instead means it is known not to be valid JSON.
+_NOT_PARSED: Any = object()
+
 
 class PegaException(Exception):
     status_code: int
     classification: str
     localized_value: str
     details: list[dict[str, Any]]
+    _content: dict[str, Any] | None
 
     def __init__(
         self,
@@ -16,16 +21,27 @@ class PegaException(Exception):
         params: dict,
         response: Response,
         override_message: str | None = None,
-    ):  # pragma: no cover
+        *,
+        content: dict[str, Any] | None = _NOT_PARSED,
+    ):
         self.base_url = base_url
         self.endpoint = endpoint
         self.params = params
         self.response = response
         self.override_message = override_message
+        self._url = base_url + endpoint
+        # Parsed once here; __str__ can be called many times when logging
+        if content is _NOT_PARSED:
+            try:
+                content = response.json()
+            except ValueError:
+                content = None
+        self._content = content
 
-    def __str__(self):  # pragma: no cover
+    def __str__(self):
         if not self.override_message:
-            return f"Request to {self.base_url + self.endpoint} with parameters {self.params} failed with error code {self.response.status_code}: {self.response.json().get('errorDetails')[0].get('localizedValue')}"
+            details = (self._content or {}).get("errorDetails") or [{}]
+            return f"Request to {self._url} with parameters {self.params} failed with error code {self.response.status_code}: {details[0].get('localizedValue')}"
         return self.override_message
 
 
@@ -130,6 +146,7 @@ def handle_pega_exception(
             params,
             response,
             "Invalid request.",
+            content=None,
         )
     details = content.get("errorDetails", None)
 
@@ -139,5 +156,5 @@ def handle_pega_exception(
     if len(details) > 1:
         raise MultipleErrors(details)
     if error := error_map.get(details[0].get("message")):
-        raise error(str(base_url), endpoint, params, response)
+        raise error(str(base_url), endpoint, params, response, content=content)
     raise Exception(details)  # pragma: no cover
@@ -146,6 +146,10 @@ def _polars_capitalize(df: F, extra_endwords: Iterable[str] | None = None) -> F:
     if len(renamed_cols) != len(set(renamed_cols)):
         renamed_cols = deduplicate(renamed_cols)
 
+    # Avoid adding a no-op rename to the plan when names are already canonical
+    if renamed_cols == cols:
+        return df
+
     return df.rename(
         dict(
             zip(
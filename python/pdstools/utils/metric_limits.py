@@ -45,11 +45,13 @@ class MetricLimits:
 
     _instance: "MetricLimits | None" = None
     _limits_df: pl.DataFrame | None
+    _limits_by_metric: dict[str, dict] | None
 
     def __new__(cls) -> "MetricLimits":
         if cls._instance is None:
             cls._instance = super().__new__(cls)
             cls._instance._limits_df = None
+            cls._instance._limits_by_metric = None
         return cls._instance
 
     @classmethod
@@ -90,22 +92,36 @@ class MetricLimits:
         return instance._limits_df
 
     @classmethod
-    def get_limit_for_metric(cls, metric_id: str) -> dict:
-        """Get limits for a specific metric. Returns empty dict if not found."""
-        df = cls.get_limits()
-        result = df.filter(pl.col("MetricID") == metric_id)
+    def _get_limits_by_metric(cls) -> dict[str, dict]:
+        """Get the limits of all metrics keyed by metric ID.
 
-        if result.is_empty():
-            return {}
+        Built once from :meth:`get_limits` and cached on the singleton, so
+        per-value RAG evaluation does a dict lookup instead of filtering the
+        limits DataFrame for every cell.
+        """
+        instance = cls()
+        if instance._limits_by_metric is not None:
+            return instance._limits_by_metric
+
+        limits_by_metric: dict[str, dict] = {}
+        for row in cls.get_limits().iter_rows(named=True):
+            limits_by_metric.setdefault(
+                row["MetricID"],
+                {
+                    "minimum": row.get("Minimum"),
+                    "best_practice_min": row.get("Best Practice Min"),
+                    "best_practice_max": row.get("Best Practice Max"),
+                    "maximum": row.get("Maximum"),
+                    "is_boolean": row.get("is_boolean", False),
+                },
+            )
+        instance._limits_by_metric = limits_by_metric
+        return limits_by_metric
 
-        row = result.row(0, named=True)
-        return {
-            "minimum": row.get("Minimum"),
-            "best_practice_min": row.get("Best Practice Min"),
-            "best_practice_max": row.get("Best Practice Max"),
-            "maximum": row.get("Maximum"),
-            "is_boolean": row.get("is_boolean", False),
-        }
+    @classmethod
+    def get_limit_for_metric(cls, metric_id: str) -> dict:
+        """Get limits for a specific metric. Returns empty dict if not found."""
+        return dict(cls._get_limits_by_metric().get(metric_id, {}))
 
     @classmethod
     def _get_limit_or_raise(cls, metric_id: str) -> dict:
@@ -186,7 +202,7 @@ class MetricLimits:
         if value is None:
             return None
 
-        limits = cls.get_limit_for_metric(metric_id)
+        limits = cls._get_limits_by_metric().get(metric_id)
         if not limits:
             return None
 
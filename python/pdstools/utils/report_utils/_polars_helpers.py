@@ -4,11 +4,13 @@ import polars as pl
 
 
 def polars_col_exists(df, col):
-    return col in df.collect_schema().names() and df.collect_schema()[col] != pl.Null
+    schema = df.collect_schema()
+    return schema.get(col, pl.Null) != pl.Null
 
 
 def polars_subset_to_existing_cols(all_columns, cols):
-    return [col for col in cols if col in all_columns]
+    existing = set(all_columns)
+    return [col for col in cols if col in existing]
 
 
 def n_unique_values(dm, all_dm_cols, fld):
@@ -17,7 +19,7 @@ def n_unique_values(dm, all_dm_cols, fld):
     fld = polars_subset_to_existing_cols(all_dm_cols, fld)
     if len(fld) == 0:
         return 0
-    return dm.model_data.select(pl.col(fld)).drop_nulls().collect().n_unique()
+    return dm.model_data.select(fld).drop_nulls().select(pl.struct(fld).n_unique()).collect().item()
 
 
 def max_by_hierarchy(dm, all_dm_cols, fld, grouping):
@@ -71,11 +73,12 @@ def sample_values(dm, all_dm_cols, fld, n=6):
             pl.concat_str(fld, separator="/").alias("__SampleValues__"),
         )
         .drop_nulls()
+        .unique()
+        .sort("__SampleValues__")
+        .head(n)
         .collect()
         .to_series()
-        .unique()
-        .sort()
-        .to_list()[:n]
+        .to_list()
     )
 
 
@@ -1,6 +1,7 @@
 """Quarto execution helpers: run, version detection, callouts, credits."""
 
 import datetime
+import functools
 import os
 import re
 import shutil
@@ -11,6 +12,8 @@ from pathlib import Path
 from ._common import logger
 from ._html import _inline_css
 
+_VERSION_PATTERN = re.compile(r"(\d+(?:\.\d+)*)")
+
 
 def _write_params_files(
     temp_dir: Path,
@@ -259,16 +262,24 @@ def _set_command_options(
 
 
 def _get_cmd_output(args: list[str]) -> list[str]:
-    """Get command output in an OS-agnostic way."""
+    """Get command output in an OS-agnostic way.
+
+    Only used for static output such as tool versions, so successful
+    results are cached for the lifetime of the process.
+    """
+    return list(_get_cached_cmd_output(tuple(args)))
+
+
+@functools.cache
+def _get_cached_cmd_output(args: tuple[str, ...]) -> tuple[str, ...]:
     try:
         result = subprocess.run(
             args,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
+            capture_output=True,
             text=True,
             check=True,
         )
-        return result.stdout.split("\n")
+        return tuple(result.stdout.split("\n"))
     except subprocess.CalledProcessError as e:
         logger.error(f"Failed to run command {' '.join(args)}: {e}")
         raise FileNotFoundError(
@@ -278,7 +289,7 @@ def _get_cmd_output(args: list[str]) -> list[str]:
 
 def _get_version_only(versionstr: str) -> str:
     """Extract version number from version string."""
-    match = re.search(r"(\d+(?:\.\d+)*)", versionstr)
+    match = _VERSION_PATTERN.search(versionstr)
     return match.group(1) if match else ""
 
 
@@ -209,7 +209,7 @@ def create_metric_itable(
 
 
 def create_metric_gttable(
-    source_table: pl.DataFrame,
+    source_table: pl.DataFrame | pl.LazyFrame,
     title: str | None = None,
     subtitle: str | None = None,
     column_to_metric: dict | None = None,
@@ -226,8 +226,9 @@ def create_metric_gttable(
 
     Parameters
     ----------
-    source_table : pl.DataFrame
-        DataFrame containing data columns to be colored.
+    source_table : pl.DataFrame | pl.LazyFrame
+        DataFrame containing data columns to be colored. A LazyFrame is
+        collected once up front.
     title : str, optional
         Table title.
     subtitle : str, optional
@@ -297,6 +298,10 @@ def create_metric_gttable(
     if not highlight_issues_only:
         RAG_COLORS["GREEN"] = "green"
 
+    if isinstance(source_table, pl.LazyFrame):
+        source_table = source_table.collect()
+    source_schema = source_table.schema
+
     gt = GT(source_table, **gt_kwargs)
     gt = gt.tab_options(
         table_font_size="12px",
@@ -310,7 +315,7 @@ def create_metric_gttable(
     # Apply column label tooltips if column_descriptions provided
     if column_descriptions:
         label_kwargs = {}
-        for col in source_table.columns:
+        for col in source_schema:
             if col in column_descriptions:
                 escaped_desc = html_module.escape(column_descriptions[col], quote=True)
                 # Wrap column label in span with title attribute for tooltip
@@ -329,7 +334,7 @@ def create_metric_gttable(
 
     # Apply formatting based on metric type using MetricFormats
     formatted_cols = set()
-    for col in source_table.columns:
+    for col in source_schema:
         metric_id = expanded_mapping.get(col, col)
         if isinstance(metric_id, tuple):
             metric_id = metric_id[0]
@@ -352,11 +357,8 @@ def create_metric_gttable(
     groupname_col = gt_kwargs.get("groupname_col")
     numeric_cols = [
         col
-        for col in source_table.columns
-        if col not in formatted_cols
-        and col != rowname_col
-        and col != groupname_col
-        and source_table[col].dtype.is_numeric()
+        for col, dtype in source_schema.items()
+        if col not in formatted_cols and col != rowname_col and col != groupname_col and dtype.is_numeric()
     ]
     if numeric_cols:
         gt = MetricFormats.DEFAULT_FORMAT.apply_to_gt(gt, numeric_cols)
@@ -368,23 +370,34 @@ def create_metric_gttable(
         strict_metric_validation=strict_metric_validation,
     )
 
-    for col in source_table.columns:
-        rag_col = f"{col}_RAG"
-        if rag_col not in df_with_rag.columns or df_with_rag[rag_col].dtype == pl.Null:
-            continue
-
-        for rag_value, color in RAG_COLORS.items():
-            row_indices = df_with_rag.with_row_index().filter(pl.col(rag_col) == rag_value)["index"].to_list()
-            if row_indices:
-                if color_background:
-                    gt = gt.tab_style(
-                        style=style.fill(color=color),
-                        locations=loc.body(columns=col, rows=row_indices),
-                    )
-                else:
-                    gt = gt.tab_style(
-                        style=style.text(color=color, weight="bold"),
-                        locations=loc.body(columns=col, rows=row_indices),
-                    )
+    # Compute the matching row indices of every (column, RAG status) pair in
+    # one Polars query instead of a separate pass per pair.
+    rag_schema = df_with_rag.schema
+    rag_targets = [
+        (col, rag_value, color)
+        for col in source_schema
+        if rag_schema.get(f"{col}_RAG", pl.Null) != pl.Null
+        for rag_value, color in RAG_COLORS.items()
+    ]
+    if rag_targets:
+        row_indices_per_target = df_with_rag.select(
+            (pl.col(f"{col}_RAG") == rag_value).arg_true().implode().alias(str(i))
+            for i, (col, rag_value, _) in enumerate(rag_targets)
+        ).row(0)
+    else:
+        row_indices_per_target = ()
+
+    for (col, _, color), row_indices in zip(rag_targets, row_indices_per_target, strict=True):
+        if row_indices:
+            if color_background:
+                gt = gt.tab_style(
+                    style=style.fill(color=color),
+                    locations=loc.body(columns=col, rows=row_indices),
+                )
+            else:
+                gt = gt.tab_style(
+                    style=style.text(color=color, weight="bold"),
+                    locations=loc.body(columns=col, rows=row_indices),
+                )
 
     return gt
@@ -49,6 +49,15 @@ def test_write_then_load(sample: ADMDatamart):
     os.remove(predictordata_cache)
 
 
+def test_save_data_file_names_have_millisecond_timestamp(tmp_path):
+    import re
+
+    dm = ADMDatamart(model_df=_minimal_model_df())
+    modeldata_cache, predictordata_cache = dm.save_data(tmp_path)
+    assert predictordata_cache is None
+    assert re.fullmatch(r"cached_model_data_\d{8}T\d{6}_\d{3}\.arrow", pathlib.Path(modeldata_cache).name)
+
+
 def test_init_without_model_data(sample: ADMDatamart):
     modeldata_cache, predictordata_cache = sample.save_data("cache2")
 
@@ -463,7 +472,7 @@ def test_normalize_performance_scale_no_performance_column():
 
 def test_validate_model_data_none_returns_none():
     dm = ADMDatamart()
-    assert dm._validate_model_data(None) is None
+    assert dm._validate_model_data(None) == (None, None)
 
 
 def test_validate_model_data_adds_success_rate_and_modeltechnique():
@@ -484,10 +493,17 @@ def test_validate_model_data_success_rate_zero_when_no_responses():
     df = _minimal_model_df(ResponseCount=[0, 100], Positives=[0, 5])
     dm = ADMDatamart(model_df=df)
     out = dm._require_model_data().collect().sort("SnapshotTime")
-    # 0/0 → NaN → filled with 0
+    # No responses → 0 instead of NaN
     assert out["SuccessRate"].to_list() == [0.0, 0.05]
 
 
+def test_validate_model_data_success_rate_null_when_response_count_missing():
+    df = _minimal_model_df(ResponseCount=[None, 100], Positives=[0, 5])
+    dm = ADMDatamart(model_df=df)
+    out = dm._require_model_data().collect().sort("SnapshotTime")
+    assert out["SuccessRate"].to_list() == [None, 0.05]
+
+
 def test_validate_model_data_normalizes_performance_above_one():
     df = _minimal_model_df(Performance=[70.0, 80.0])
     dm = ADMDatamart(model_df=df)
@@ -504,6 +520,82 @@ def test_validate_model_data_is_updated_flag():
     assert out["IsUpdated"].to_list() == [True, False]
 
 
+def _two_model_df():
+    import datetime
+
+    return pl.LazyFrame(
+        {
+            "ModelID": ["m1", "m1", "m2", "m2"],
+            "SnapshotTime": [
+                datetime.datetime(2024, 1, 1),
+                datetime.datetime(2024, 1, 2),
+                datetime.datetime(2024, 1, 1),
+                datetime.datetime(2024, 1, 2),
+            ],
+            "Name": ["Action A", "Action A", "Action B", "Action B"],
+            "Channel": ["Web", "Web", "Email", "Email"],
+            "Direction": ["Inbound"] * 4,
+            "Issue": ["Sales"] * 4,
+            "Group": ["Cards"] * 4,
+            "Configuration": ["OmniAdaptiveModel"] * 4,
+            "ResponseCount": [100, 100, 50, 80],
+            "Positives": [10, 10, 5, 8],
+            "Performance": [0.7, 0.7, 0.6, 0.65],
+        }
+    )
+
+
+def test_validate_model_data_model_level_query_keeps_first_action_dates():
+    dm = ADMDatamart(model_df=_two_model_df(), query={"Channel": ["Web"]})
+    out = dm._require_model_data().collect()
+    assert out["ModelID"].to_list() == ["m1", "m1"]
+    assert out["IsUpdated"].to_list() == [True, False]
+    # First action dates are derived from the unfiltered data
+    assert dm._require_first_action_dates().collect()["Name"].to_list() == ["Action A", "Action B"]
+
+
+def test_validate_model_data_snapshot_query_applied_after_derivations():
+    import datetime
+
+    dm = ADMDatamart(
+        model_df=_two_model_df(),
+        query=pl.col("SnapshotTime") > datetime.datetime(2024, 1, 1),
+    )
+    out = dm._require_model_data().collect().sort("ModelID")
+    # IsUpdated still compares against the (filtered-out) first snapshot
+    assert out["IsUpdated"].to_list() == [False, True]
+
+
+@pytest.mark.parametrize(
+    "query, expected_model_ids",
+    [
+        ({"ModelID": ["1"]}, ["1", "1"]),
+        (pl.col("ModelID") == "2", ["2", "2"]),
+        (pl.col("Channel").to_physical() == pl.col("Channel").to_physical().first(), ["1", "1"]),
+        (pl.col("Channel").cat.get_categories().len() > 0, ["1", "1", "2", "2"]),
+    ],
+)
+def test_validate_model_data_model_level_query_uses_schema_types(query, expected_model_ids):
+    # Raw ModelID is numeric and Channel a plain String, but queries are
+    # written against the schema types (Utf8 and Categorical)
+    df = _two_model_df().with_columns(ModelID=pl.Series([1, 1, 2, 2]))
+    dm = ADMDatamart(model_df=df, query=query)
+    out = dm._require_model_data().collect()
+    assert out.schema["ModelID"] == pl.Utf8
+    assert out.schema["Channel"] == pl.Categorical
+    assert sorted(out["ModelID"].to_list()) == expected_model_ids
+
+
+def test_is_model_level_query():
+    dm = ADMDatamart()
+    columns = ["ModelID", "Channel", "SnapshotTime"]
+    assert dm._is_model_level_query({"Channel": ["Web"]}, columns)
+    assert dm._is_model_level_query([pl.col("ModelID") == "m1"], columns)
+    assert not dm._is_model_level_query(pl.col("SnapshotTime").is_not_null(), columns)
+    assert not dm._is_model_level_query({"Issue": ["Sales"]}, columns)
+    assert not dm._is_model_level_query(None, columns)
+
+
 # ---- _validate_predictor_data --------------------------------------------
 
 
@@ -663,6 +755,14 @@ def test_get_first_action_dates_returns_min_per_action():
     ]
 
 
+def test_first_action_dates_categorical_name_joins_with_model_data():
+    df = _two_model_df().with_columns(pl.col("Name").cast(pl.Categorical))
+    dm = ADMDatamart(model_df=df)
+    assert dm._require_first_action_dates().collect_schema()["Name"] == pl.Utf8
+    out = dm.aggregates.summary_by_channel().collect().sort("Channel")
+    assert out["Channel"].to_list() == ["Email", "Web"]
+
+
 # ---- _require_* error paths ----------------------------------------------
 
 
@@ -697,3 +797,24 @@ def test_require_model_data_returns_lazyframe_when_present():
     dm = ADMDatamart(model_df=_minimal_model_df())
     assert isinstance(dm._require_model_data(), pl.LazyFrame)
     assert isinstance(dm._require_first_action_dates(), pl.LazyFrame)
+
+
+def test_materialize_for_reporting_keeps_model_data():
+    dm = ADMDatamart(model_df=_minimal_model_df(), predictor_df=_minimal_predictor_df())
+    before = dm._require_model_data().collect()
+    first_action_dates_before = dm._require_first_action_dates().collect()
+    dm.materialize_for_reporting()
+    assert isinstance(dm.model_data, pl.LazyFrame)
+    assert dm._require_model_data().collect().equals(before)
+    # Both frames now read from memory rather than the source pipeline
+    assert dm._require_model_data().explain().startswith("DF [")
+    assert dm._require_first_action_dates().explain().startswith("DF [")
+    assert dm._require_first_action_dates().collect().equals(first_action_dates_before)
+    assert dm.combined_data is not None
+    assert dm.combined_data.select(pl.col("ModelID").unique()).collect()["ModelID"].to_list() == ["m1"]
+
+
+def test_materialize_for_reporting_without_model_data_is_noop():
+    dm = ADMDatamart()
+    dm.materialize_for_reporting()
+    assert dm.model_data is None
@@ -15,7 +15,7 @@ def sample_datamart(monkeypatch):
     monkeypatch.setattr(
         ADMDatamart,
         "_validate_model_data",
-        lambda self, df, **kwargs: df,
+        lambda self, df, **kwargs: (df, None),
     )
 
     model_data = pl.DataFrame(
@@ -160,7 +160,7 @@ def test_requires_decorator(monkeypatch):
     monkeypatch.setattr(
         ADMDatamart,
         "_validate_model_data",
-        lambda self, df, **kwargs: df,
+        lambda self, df, **kwargs: (df, None),
     )
 
     # Create a datamart with missing data
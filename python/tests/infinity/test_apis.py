@@ -220,3 +220,52 @@ def test_error_handling(httpx_mock: HTTPXMock, mock_auth):
     )
     with pytest.raises(_exceptions.NoMonitoringInfo):
         client.post("/test")
+
+
+def test_pega_exception_message_parses_response_once(monkeypatch):
+    response = httpx.Response(
+        400,
+        json={"errorDetails": [{"localizedValue": "Something went wrong"}]},
+    )
+    error = _exceptions.PegaException("https://pega.com", "/test", {"a": 1}, response)
+
+    def fail_json():
+        raise AssertionError("response body parsed again")
+
+    monkeypatch.setattr(response, "json", fail_json)
+    expected = (
+        "Request to https://pega.com/test with parameters {'a': 1} failed with error code 400: Something went wrong"
+    )
+    assert str(error) == expected
+    assert str(error) == expected
+
+
+def test_pega_exception_message_without_json_body():
+    response = httpx.Response(500, content=b"not json")
+    error = _exceptions.PegaException("https://pega.com", "/test", {}, response)
+    assert str(error) == "Request to https://pega.com/test with parameters {} failed with error code 500: None"
+
+
+def test_handle_pega_exception_reuses_parsed_content():
+    content = {"errorDetails": [{"message": "Error_ShadowCC_Exists"}]}
+    response = httpx.Response(400, json=content)
+    with pytest.raises(_exceptions.ShadowCCExists) as exc_info:
+        _exceptions.handle_pega_exception("https://pega.com", "/test", {}, response)
+    assert exc_info.value._content is not None
+    assert exc_info.value._content == content
+
+
+def test_handle_pega_exception_invalid_json_parsed_once(monkeypatch):
+    response = httpx.Response(500, content=b"not json")
+    calls = []
+    original_json = response.json
+
+    def counting_json():
+        calls.append(1)
+        return original_json()
+
+    monkeypatch.setattr(response, "json", counting_json)
+    with pytest.raises(_exceptions.InvalidRequest) as exc_info:
+        _exceptions.handle_pega_exception("https://pega.com", "/test", {}, response)
+    assert len(calls) == 1
+    assert exc_info.value._content is None
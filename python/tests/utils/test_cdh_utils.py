@@ -623,6 +623,14 @@ def test_capitalize_behavior():
     assert cdh_utils._capitalize("Response_count1") == ["Response_Count1"]
 
 
+def test_polars_capitalize_already_capitalized_returns_same_frame():
+    df = pl.LazyFrame({"ModelID": [1], "ResponseCount": [2]})
+    assert cdh_utils._polars_capitalize(df) is df
+
+    renamed = cdh_utils._polars_capitalize(pl.LazyFrame({"pyModelID": [1], "responsecount": [2]}))
+    assert renamed.collect_schema().names() == ["ModelID", "ResponseCount"]
+
+
 def test_capitalize_configuration():
     """Test that 'Configuration' is capitalized correctly.
 
@@ -34,6 +34,18 @@ class TestMetricLimits:
         limits = MetricLimits.get_limit_for_metric("UnknownMetricXYZ123")
         assert limits == {}
 
+    def test_get_limit_for_metric_matches_limits_table(self):
+        row = MetricLimits.get_limits().filter(pl.col("MetricID") == "ModelPerformance").row(0, named=True)
+        limits = MetricLimits.get_limit_for_metric("ModelPerformance")
+        assert limits["minimum"] == row["Minimum"]
+        assert limits["maximum"] == row["Maximum"]
+        assert limits["best_practice_min"] == row["Best Practice Min"]
+        assert limits["best_practice_max"] == row["Best Practice Max"]
+
+        # Callers get a copy; mutating it must not affect the cached limits
+        limits["minimum"] = -1
+        assert MetricLimits.get_limit_for_metric("ModelPerformance")["minimum"] == row["Minimum"]
+
     def test_get_metric_RAG_code_returns_expression(self):
         expr = MetricLimits.get_metric_RAG_code("col", "ModelPerformance")
         assert isinstance(expr, pl.Expr)
@@ -455,6 +455,41 @@ def test_create_metric_gttable_callable_rag_without_format():
     assert "12345.678" not in html  # Raw value should not appear
 
 
+def test_create_metric_gttable_rag_rows_styled():
+    """RAG colours are applied to exactly the rows that match each status."""
+    df = pl.DataFrame(
+        {
+            "Channel": ["Web", "Mobile", "Email", "Push"],
+            "Score": [1.0, 5.0, 9.0, None],
+        },
+    )
+
+    def score_rag(value):
+        if value > 8:
+            return "RED"
+        return "AMBER" if value > 4 else "GREEN"
+
+    gt = report_utils.create_metric_gttable(
+        df,
+        column_to_metric={"Score": score_rag},
+        strict_metric_validation=False,
+    )
+
+    styled = {(s.colname, s.rownum): s.styles[0].color for s in gt._styles}
+    assert styled == {("Score", 2): "orangered", ("Score", 1): "orange"}
+
+
+def test_create_metric_gttable_accepts_lazyframe():
+    df = pl.DataFrame({"Channel": ["Web", "Mobile"], "Score": [1.0, 9.0]})
+    gt = report_utils.create_metric_gttable(
+        df.lazy(),
+        column_to_metric={"Score": lambda v: "RED" if v > 8 else "GREEN"},
+        strict_metric_validation=False,
+    )
+    assert gt._tbl_data.equals(df)
+    assert [(s.colname, s.rownum) for s in gt._styles] == [("Score", 1)]
+
+
 class TestGetVersionOnlyEdgeCases:
     """Edge cases for _get_version_only not covered by test_get_version_only."""
 
@@ -782,6 +817,20 @@ class TestHierarchyHelpers:
         # Channel+Issue combinations: Web/Sales, Web/Retention, Email/Sales, Email/Retention, SMS/Sales
         assert report_utils.n_unique_values(dm, cols, ["Channel", "Issue"]) == 5
 
+    def test_n_unique_values_skips_rows_with_nulls(self):
+        dm = _FakeDM(
+            pl.DataFrame(
+                {
+                    "Channel": ["Web", "Web", None, "SMS"],
+                    "Issue": ["Sales", None, "Sales", "Sales"],
+                }
+            )
+        )
+        cols = ["Channel", "Issue"]
+        # Only rows without nulls in any of the fields count
+        assert report_utils.n_unique_values(dm, cols, ["Channel", "Issue"]) == 2
+        assert report_utils.n_unique_values(dm, cols, "Channel") == 2
+
     def test_n_unique_values_missing_field_returns_zero(self):
         dm, cols = self._dm()
         assert report_utils.n_unique_values(dm, cols, "DoesNotExist") == 0
@@ -805,6 +854,20 @@ class TestHierarchyHelpers:
         # Per Channel: Web=3, Email=2, SMS=1 -> mean=(3+2+1)/3=2.0
         assert report_utils.avg_by_hierarchy(dm, cols, "Action", ["Channel"]) == pytest.approx(2.0)
 
+    def test_by_hierarchy_ignores_nulls(self):
+        dm = _FakeDM(
+            pl.DataFrame(
+                {
+                    "Channel": ["Web", "Web", "Web", "SMS"],
+                    "Action": ["A", None, "B", None],
+                }
+            )
+        )
+        cols = ["Channel", "Action"]
+        # Web has 2 non-null actions, SMS has none
+        assert report_utils.max_by_hierarchy(dm, cols, "Action", ["Channel"]) == 2
+        assert report_utils.avg_by_hierarchy(dm, cols, "Action", ["Channel"]) == pytest.approx(1.0)
+
     def test_avg_by_hierarchy_missing_field(self):
         dm, cols = self._dm()
         assert report_utils.avg_by_hierarchy(dm, cols, "Missing", ["Channel"]) == 0
@@ -988,6 +1051,21 @@ class TestGetCmdOutput:
         with pytest.raises(FileNotFoundError, match="Command failed"):
             report_utils._get_cmd_output(["false"])
 
+    def test_output_is_cached(self, monkeypatch):
+        report_utils._quarto._get_cached_cmd_output.cache_clear()
+        calls = []
+        real_run = report_utils._quarto.subprocess.run
+
+        def counting_run(*args, **kwargs):
+            calls.append(args)
+            return real_run(*args, **kwargs)
+
+        monkeypatch.setattr(report_utils._quarto.subprocess, "run", counting_run)
+        first = report_utils._get_cmd_output(["echo", "cached"])
+        first.append("mutated")
+        assert report_utils._get_cmd_output(["echo", "cached"]) == ["cached", ""]
+        assert len(calls) == 1
+
 
 class TestGetQuartoAndPandoc:
     """Tests for get_quarto_with_version / get_pandoc_with_version."""